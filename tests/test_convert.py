@@ -0,0 +1,35 @@
+from math import isclose
+
+import pytest
+
+from z_units import convert, convert_array
+
+
+def test_convert():
+    x = convert(1, 'm', 'ft')
+    assert x.__class__.__name__ == 'Length'
+    assert isclose(x.value, 3.28084, rel_tol=1e-4)
+    assert isclose(convert(1, 'kmol/s', 'kmol/h').value, 3600)
+    assert isclose(convert(25, 'C', 'K').value, 298.15)
+    with pytest.raises(ValueError):
+        convert(1, 'm', 'kg')
+    with pytest.raises(ValueError):
+        convert(1, 'm', 'unknown')
+
+
+def test_convert_array():
+    values = [0, 25, 100]
+    converted = convert_array(values, 'C', 'F')
+    assert len(converted) == len(values)
+    for x, y in zip(values, converted):
+        assert isclose(y, convert(x, 'C', 'F').value)
+    assert isclose(convert_array((1, 2), 'kPa', 'kPag')[1], convert(2, 'kPa', 'kPag').value)
+    assert isclose(convert_array(2.5, 'm', 'mm'), 2500)
+
+
+def test_convert_same_unit():
+    x = convert(5, 'kPag', 'kPag')
+    assert x.value == 5
+    assert x.unit.symbol == 'kPag'
+    with pytest.raises(ValueError):
+        convert(5, 'unknown', 'unknown')
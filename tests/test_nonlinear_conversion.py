@@ -0,0 +1,24 @@
+from math import isclose
+
+from z_units import config
+from z_units import quantity as q
+
+
+def test_convert():
+    config.set_standard_temperature(20)
+    f = q.MolarFlow(1, 'Nm3/h')
+    f1 = f.to('Sm3/h').value
+    config.set_standard_temperature(15)
+    f2 = f.to('Sm3/h').value
+    assert not isclose(f1, f2)
+    config.set_standard_temperature(20)
+
+
+def test_gauge_pressure_follows_config():
+    atmospheric_pressure = config.get_local_atmospheric_pressure()
+    p = q.Pressure(100, 'kPa')
+    p1 = p.to('kPag').value
+    config.set_local_atmospheric_pressure(50e3)
+    assert isclose(p.to('kPag').value, 50)
+    config.set_local_atmospheric_pressure(atmospheric_pressure)
+    assert p.to('kPag').value == p1
@@ -1,6 +1,8 @@
 from math import isclose
 
-from z_units import quantity as q
+import pytest
+
+from z_units import quantity as q, unit
 from z_units.config import set_local_atmospheric_pressure, set_standard_temperature, get_standard_temperature
 
 
@@ -449,3 +451,62 @@ def test_operation():
     assert q.Length(200, 'cm') >= q.Length(1000, 'mm')
     assert q.Length(1, 'cm') * 100 == q.Length(1, 'm')
     assert 200 * q.Length(1, 'mm') == q.Length(2, 'dm')
+
+
+def test_convert_array():
+    values = [0, 1, 2.5]
+    converted = q.Length.convert_array(values, 'm', 'ft')
+    assert isinstance(converted, list)
+    for x, y in zip(values, converted):
+        assert isclose(y, q.Length(x).to('ft').value)
+    assert isclose(q.Temperature.convert_array(25, 'C', 'K'), 298.15)
+
+
+def test_unit_object():
+    x = q.Length(1, unit.meter)
+    assert x.unit is unit.meter
+    assert x.to(unit.foot).unit is unit.foot
+    assert isclose(x.to(unit.foot).value, x.to('ft').value)
+    # an equivalent unit not taken from the registry resolves by symbol
+    assert x.to(unit.Unit('mm', factor=1e-3)).unit is unit.millimeter
+
+
+def test_array_value():
+    x = q.Length([0, 1, 2.5], 'm').to('ft')
+    assert x.unit.symbol == 'ft'
+    assert x.value == q.Length.convert_array([0, 1, 2.5], 'm', 'ft')
+    assert q.Temperature((0, 100), 'C').to('K').value == [273.15, 373.15]
+
+
+def test_subclass_registry():
+    class MyLength(q.Length):
+        __slots__ = ()
+
+    assert MyLength.get_unit_registry() is q.Length.get_unit_registry()
+    assert MyLength(1, 'km').to('m').value == 1000
+
+
+def test_missing_registry():
+    class Config(q.Quantity):
+        __slots__ = ()
+
+    with pytest.raises(TypeError, match='unit_registry.config'):
+        Config(1)
+    with pytest.raises(TypeError):
+        q.Quantity(1)
+
+
+def test_unknown_unit():
+    with pytest.raises(ValueError):
+        q.Length(1, 'kg')
+    with pytest.raises(ValueError):
+        q.Length(1, ['m'])
+    with pytest.raises(ValueError):
+        q.Length(1).to(['ft'])
+
+
+def test_private_subclass_registry():
+    class _Length(q.Quantity):
+        __slots__ = ()
+
+    assert _Length.get_unit_registry() is q.Length.get_unit_registry()
@@ -12,3 +12,13 @@ def test_unit():
     print((unit.minute * unit.minute).factor)
     print((10 * unit.minute).factor)
     # assert False
+
+
+def test_factor_definition():
+    assert (10 * unit.minute).factor == 600
+    assert (unit.minute * 10).factor == 600
+    assert (unit.hour / 60).factor == 60
+    assert (1e3 * unit.meter / unit.hour).factor == 1e3 / 3600
+    assert (unit.meter / (2 * unit.second)).factor == 0.5
+    assert unit.Unit('km/h', defined_by=1e3 * unit.meter / unit.hour).factor == 1e3 / 3600
+    assert ((1e3 * unit.meter) ** 2).factor == 1e6
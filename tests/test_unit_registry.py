@@ -0,0 +1,54 @@
+import pytest
+
+from z_units import unit
+from z_units.quantity import ALL_QUANTITIES
+from z_units.unit_registry import UnitRegistry
+
+
+def test_base_unit():
+    registry = UnitRegistry([unit.meter, unit.foot])
+    assert registry.base_unit is unit.meter
+    registry = UnitRegistry([unit.meter, unit.foot], base_unit=unit.foot)
+    assert registry.base_unit is unit.foot
+    assert registry.get_unit('m') is unit.meter
+    with pytest.raises(ValueError):
+        UnitRegistry([unit.meter], base_unit=unit.foot)
+    with pytest.raises(ValueError):
+        UnitRegistry([unit.foot])
+
+
+class _SquareUnit(unit.Unit):
+    __slots__ = ()
+
+    def to_base_unit(self, value):
+        return value * value
+
+    def from_base_unit(self, value):
+        return value ** 0.5
+
+
+def test_nonlinear_unit():
+    square = _SquareUnit('sq')
+    registry = UnitRegistry([unit.BaseUnit('x'), square])
+    assert registry.convert(3, square, registry.base_unit) == 9
+    assert registry.convert([2, 3], square, registry.base_unit) == [4, 9]
+    assert registry.convert(9, registry.base_unit, square) == 3
+
+
+def test_convert_matches_base_unit_round_trip():
+    for quantity in ALL_QUANTITIES:
+        registry = quantity.get_unit_registry()
+        for from_unit in registry.units:
+            for to_unit in registry.units:
+                for value in (-40, 0.1, 3):
+                    expected = to_unit.from_base_unit(from_unit.to_base_unit(value))
+                    assert registry.convert(value, from_unit, to_unit) == expected
+
+
+def test_function_factor_not_cached():
+    factor = [2]
+    scaled = unit.Unit('y', factor=lambda: factor[0])
+    registry = UnitRegistry([unit.BaseUnit('x'), scaled])
+    assert registry.convert(1, scaled, registry.base_unit) == 2
+    factor[0] = 3
+    assert registry.convert(1, scaled, registry.base_unit) == 3
@@ -1,3 +1,74 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
 from . import quantity
 from . import unit
 from . import config
+from .quantity import Quantity, ALL_QUANTITIES
+
+# symbol -> quantity classes whose unit registry contains that symbol,
+# built on first use
+_symbol_to_classes = None
+
+
+def _get_symbol_to_classes() -> dict:
+    global _symbol_to_classes
+    if _symbol_to_classes is None:
+        symbol_to_classes = {}
+        for cls in ALL_QUANTITIES:
+            for symbol in cls.get_unit_registry().symbols:
+                symbol_to_classes.setdefault(symbol, []).append(cls)
+        _symbol_to_classes = symbol_to_classes
+
+    return _symbol_to_classes
+
+
+@lru_cache(maxsize=1024)
+def _resolve(from_unit: str, to_unit: str):
+    """
+    Find the quantity class both units belong to
+    :param from_unit: unit symbol
+    :param to_unit: unit symbol
+    :return: Quantity subclass
+    """
+    symbol_to_classes = _get_symbol_to_classes()
+    to_classes = symbol_to_classes.get(to_unit, ())
+    for cls in symbol_to_classes.get(from_unit, ()):
+        if cls in to_classes:
+            return cls
+
+    raise ValueError(f"Unable to convert from '{from_unit}' to '{to_unit}'")
+
+
+def convert(value, from_unit: str, to_unit: str) -> Quantity:
+    """
+    Convert value between units without naming the quantity,
+    the quantity is looked up by the unit symbols.
+
+    Symbols shared by several quantities (e.g. 'C' for Temperature and
+    DeltaTemperature) resolve to the first quantity defined.
+
+    :param value: numerical value in from_unit
+    :param from_unit: symbol of the unit value is given in
+    :param to_unit: symbol of the unit to convert to
+    :return: quantity in to_unit
+    """
+    cls = _resolve(from_unit, to_unit)
+    if from_unit == to_unit:
+        return cls(value, from_unit)
+
+    return cls(value, from_unit).to(to_unit)
+
+
+def convert_array(values, from_unit: str, to_unit: str):
+    """
+    Convert a batch of values between units without naming the quantity,
+    see Quantity.convert_array()
+
+    :param values: array-like of numerical values in from_unit
+    :param from_unit: symbol of the unit values are given in
+    :param to_unit: symbol of the unit to convert to
+    :return: converted values, a list for list / tuple input
+    """
+    return _resolve(from_unit, to_unit).convert_array(values, from_unit, to_unit)
@@ -1,9 +1,8 @@
 from . import constant
 
-_config = {
-    'local_atmospheric_pressure': constant.ATM,
-    'standard_temperature': 20
-}
+# read directly by the config dependent units, set through the functions below
+_local_atmospheric_pressure = constant.ATM
+_standard_temperature = 20
 
 
 def set_standard_temperature(temperature):
@@ -13,14 +12,15 @@ def set_standard_temperature(temperature):
     :param temperature: number in 'C'
     :return:
     """
+    global _standard_temperature
     if isinstance(temperature, (int, float)):
-        _config['standard_temperature'] = temperature
+        _standard_temperature = temperature
     else:
         raise ValueError(f"{temperature} is not a number.")
 
 
 def get_standard_temperature():
-    return _config['standard_temperature']
+    return _standard_temperature
 
 
 def set_local_atmospheric_pressure(pressure):
@@ -30,12 +30,13 @@ def set_local_atmospheric_pressure(pressure):
     :param pressure: number in 'Pa'
     :return:
     """
+    global _local_atmospheric_pressure
     if isinstance(pressure, (int, float)):
         value = pressure
     else:
         raise ValueError(f"{pressure} is not a number.")
-    _config['local_atmospheric_pressure'] = value
+    _local_atmospheric_pressure = value
 
 
 def get_local_atmospheric_pressure():
-    return _config['local_atmospheric_pressure']
+    return _local_atmospheric_pressure
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-from functools import cached_property
-from typing import List, Union
+from typing import Tuple, Union
 
 from .unit import Unit
 from .unit_registry import UnitRegistry
@@ -9,6 +8,11 @@ from . import unit_registry as reg
 from .util import camel_to_snake
 
 
+def _no_unit_registry(cls) -> TypeError:
+    return TypeError(f"{cls.__name__} has no unit registry, "
+                     f"expected a UnitRegistry named unit_registry.{camel_to_snake(cls.__name__)}")
+
+
 class Quantity:
     """
     Class used to represent a Quantity
@@ -16,44 +20,94 @@ class Quantity:
     A quantity has a value and a unit
     """
 
-    # unit_registry: UnitRegistry = None
+    __slots__ = ('value', '_unit')
+
+    # set per subclass in __init_subclass__
+    _unit_registry: UnitRegistry = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # registry named after the class, e.g. MassFlow -> unit_registry.mass_flow,
+        # otherwise the one inherited is kept
+        if isinstance(registry := getattr(reg, camel_to_snake(cls.__name__), None), UnitRegistry):
+            cls._unit_registry = registry
 
     def __init__(self, value, unit: Union[str, Unit] = None):
+        if (registry := self._unit_registry) is None:
+            raise _no_unit_registry(type(self))
         self.value = value
         if unit is None:
-            self._unit = self.unit_registry.base_unit
+            self._unit = registry.base_unit
         else:
-            self._unit = self.unit_registry.get_unit(str(unit))
+            self._unit = registry.get_unit(unit)
 
     def to(self, unit: Union[str, Unit]):
         if self.value is None:
             return None
-        unit = self.unit_registry.get_unit(str(unit))
-        if unit == self.unit:
+        registry = self.unit_registry
+        unit = registry.get_unit(unit)
+        if unit is self._unit:
             return self
-        ref_value = self._unit.to_base_unit(self.value)
-        value = unit.from_base_unit(ref_value)
-        return self.__class__(value, unit)
+        value = registry.convert(self.value, self._unit, unit)
+        return self._from_validated(value, unit)
+
+    @classmethod
+    def _from_validated(cls, value, unit: Unit):
+        """
+        Create a quantity from a unit already taken from the unit registry,
+        skipping the symbol lookup in __init__
+        """
+        quantity = cls.__new__(cls)
+        quantity.value = value
+        quantity._unit = unit
+        return quantity
+
+    @classmethod
+    def convert_array(cls, values, from_unit: Union[str, Unit], to_unit: Union[str, Unit]):
+        """
+        Convert a batch of values between two units of this quantity.
+
+        Values are converted through the base unit as a whole when they support
+        arithmetic (e.g. numpy.ndarray), or element-wise for a list / tuple.
+
+        :param values: array-like of numerical values in from_unit
+        :param from_unit: unit values are given in
+        :param to_unit: unit to convert to
+        :return: converted values, a list for list / tuple input
+        """
+        registry = cls.get_unit_registry()
+        return registry.convert(values, registry.get_unit(from_unit), registry.get_unit(to_unit))
 
     @classmethod
     def get_unit_registry(cls) -> UnitRegistry:
-        return getattr(reg, camel_to_snake(cls.__name__))
+        if (registry := cls._unit_registry) is None:
+            raise _no_unit_registry(cls)
+        return registry
 
-    @cached_property
-    def unit_registry(self):
-        return self.get_unit_registry()
+    @property
+    def unit_registry(self) -> UnitRegistry:
+        return self._unit_registry
 
     @property
     def base_unit(self) -> Unit:
         return self.unit_registry.base_unit
 
     @property
-    def units(self) -> List[Unit]:
+    def units(self) -> Tuple[Unit, ...]:
         return self.unit_registry.units
 
     def to_base(self):
         return self.to(self.base_unit)
 
+    def _base_value(self):
+        """
+        Value in base unit, as to_base().value without creating a quantity
+        """
+        registry = self._unit_registry
+        if self._unit is registry.base_unit:
+            return self.value
+        return registry.convert(self.value, self._unit, registry.base_unit)
+
     def __repr__(self):
         if isinstance(self.value, float):
             return f"<{self.__class__.__name__}({self.value:.9}, '{self.unit.symbol}')>"
@@ -63,6 +117,9 @@ class Quantity:
         return f'{self.value}'
 
     def __format__(self, format_spec=''):
+        if not format_spec:
+            return format(self.value)
+
         if (pos := format_spec.find('u')) > -1:
             unit = format(self.unit, format_spec[pos + 1:])
             format_spec = format_spec[0:pos]
@@ -73,7 +130,7 @@ class Quantity:
 
     def __mul__(self, other):
         if isinstance(other, (int, float)):
-            return self.__class__(self.value * other, self.unit)
+            return self._from_validated(self.value * other, self._unit)
 
         return NotImplemented
 
@@ -82,17 +139,17 @@ class Quantity:
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            return self.to_base().value == other.to_base().value
+            return self._base_value() == other._base_value()
 
         return False
 
     def __gt__(self, other):
         if isinstance(other, self.__class__):
-            return self.to_base().value > other.to_base().value
+            return self._base_value() > other._base_value()
 
     def __ge__(self, other):
         if isinstance(other, self.__class__):
-            return self.to_base().value >= other.to_base().value
+            return self._base_value() >= other._base_value()
 
     @property
     def unit(self) -> Unit:
@@ -100,128 +157,165 @@ class Quantity:
 
 
 class Length(Quantity):
-    pass
+    __slots__ = ()
 
 
 class Area(Quantity):
-    pass
+    __slots__ = ()
 
 
 class Volume(Quantity):
-    pass
+    __slots__ = ()
 
 
 class Time(Quantity):
-    pass
+    __slots__ = ()
 
 
 class Mass(Quantity):
-    pass
+    __slots__ = ()
 
 
 class Force(Quantity):
-    pass
+    __slots__ = ()
 
 
 class Substance(Quantity):
-    pass
+    __slots__ = ()
 
 
 class Energy(Quantity):
-    pass
+    __slots__ = ()
 
 
 class Velocity(Quantity):
-    pass
+    __slots__ = ()
 
 
 class Temperature(Quantity):
-    pass
+    __slots__ = ()
 
 
 class DeltaTemperature(Quantity):
-    pass
+    __slots__ = ()
 
 
 class Pressure(Quantity):
-    pass
+    __slots__ = ()
 
 
 class VolumeFlow(Quantity):
-    pass
+    __slots__ = ()
 
 
 class MassDensity(Quantity):
-    pass
+    __slots__ = ()
 
 
 class HeatFlow(Quantity):
-    pass
+    __slots__ = ()
 
 
 class MolarFlow(Quantity):
-    pass
+    __slots__ = ()
 
 
 class MassFlow(Quantity):
-    pass
+    __slots__ = ()
 
 
 class MolarDensity(Quantity):
-    pass
+    __slots__ = ()
 
 
 class MolarHeatCapacity(Quantity):
-    pass
+    __slots__ = ()
 
 
 class MolarEntropy(Quantity):
-    pass
+    __slots__ = ()
 
 
 class MolarHeat(Quantity):
-    pass
+    __slots__ = ()
 
 
 class ThermalConductivity(Quantity):
-    pass
+    __slots__ = ()
 
 
 class Viscosity(Quantity):
-    pass
+    __slots__ = ()
 
 
 class SurfaceTension(Quantity):
-    pass
+    __slots__ = ()
 
 
 class MassHeatCapacity(Quantity):
-    pass
+    __slots__ = ()
 
 
 class MassEntropy(Quantity):
-    pass
+    __slots__ = ()
 
 
 class MassHeat(Quantity):
-    pass
+    __slots__ = ()
 
 
 class StandardGasFlow(Quantity):
-    pass
+    __slots__ = ()
 
 
 class KinematicViscosity(Quantity):
-    pass
+    __slots__ = ()
 
 
 class MolarVolume(Quantity):
-    pass
+    __slots__ = ()
 
 
 class Fraction(Quantity):
-    pass
+    __slots__ = ()
 
 
 class Dimensionless(Quantity):
-    pass
+    __slots__ = ()
+
+
+# all predefined quantities, in definition order
+ALL_QUANTITIES = (
+    Length,
+    Area,
+    Volume,
+    Time,
+    Mass,
+    Force,
+    Substance,
+    Energy,
+    Velocity,
+    Temperature,
+    DeltaTemperature,
+    Pressure,
+    VolumeFlow,
+    MassDensity,
+    HeatFlow,
+    MolarFlow,
+    MassFlow,
+    MolarDensity,
+    MolarHeatCapacity,
+    MolarEntropy,
+    MolarHeat,
+    ThermalConductivity,
+    Viscosity,
+    SurfaceTension,
+    MassHeatCapacity,
+    MassEntropy,
+    MassHeat,
+    StandardGasFlow,
+    KinematicViscosity,
+    MolarVolume,
+    Fraction,
+    Dimensionless,
+)
@@ -1,10 +1,27 @@
 from __future__ import annotations
+import sys
 from typing import Union, Callable
 
-from .config import get_local_atmospheric_pressure, get_standard_temperature
-from .util import multi_replace
+from .config import get_local_atmospheric_pressure
+from . import config
 from . import constant
 
+# python style -> quick style, see Unit.symbol_quick_style
+# '**' goes first, so the single '*' left are multiplications
+_quick_style_table = str.maketrans({'*': '-', '(': None, ')': None})
+
+
+def _to_quick_style(symbol: str) -> str:
+    return symbol.replace('**', '').translate(_quick_style_table)
+
+
+# format spec -> attribute holding the symbol in that style
+_format_styles = {
+    '': '_symbol_quick',
+    'q': '_symbol_quick',
+    'p': '_symbol',
+}
+
 
 class Unit:
     """
@@ -48,34 +65,58 @@ class Unit:
         offset value
     """
 
+    __slots__ = ('_symbol', '_symbol_quick', '_factor', '_offset', '_is_constant')
+
     def __init__(self, symbol: str, defined_by=None, factor: Union[float, Callable] = 1,
                  offset: Union[float, Callable] = 0):
-        if isinstance(defined_by, Unit):
+        if defined_by is not None:
             factor = defined_by.factor
 
-        if factor == 0:
+        if not callable(factor) and factor == 0:
             raise ValueError("Factor shall not be 0")
 
-        self._symbol = symbol.replace(' ', '')
+        self._symbol = sys.intern(symbol.replace(' ', ''))
+        if self._symbol:
+            self._symbol_quick = sys.intern(_to_quick_style(self._symbol))
+        else:
+            self._symbol_quick = self._symbol
         self._factor = factor
         self._offset = offset
+        self._is_constant = not (callable(factor) or callable(offset))
 
     def to_base_unit(self, value: float):
         """
-        Convert value from this unit to base unit
-        :param value: numerical value
+        Convert value from this unit to base unit,
+        factor and offset are applied in one expression, so value may also be
+        an array supporting arithmetic (e.g. numpy.ndarray)
+        :param value: numerical value or array
         :return: converted value
         """
+        if self._is_constant:
+            return self._factor * value + self._offset
+
         return self.factor * value + self.offset
 
     def from_base_unit(self, value: float):
         """
-        Convert value from base unit to this unit
-        :param value: numerical valve
-        :return: converted valve
+        Convert value from base unit to this unit,
+        value may also be an array supporting arithmetic (e.g. numpy.ndarray)
+        :param value: numerical value or array
+        :return: converted value
         """
+        if self._is_constant:
+            return (value - self._offset) / self._factor
+
         return (value - self.offset) / self.factor
 
+    @property
+    def is_constant(self):
+        """
+        Whether factor and offset are plain numbers,
+        rather than functions
+        """
+        return self._is_constant
+
     @property
     def symbol_quick_style(self):
         """
@@ -96,15 +137,7 @@ class Unit:
 
         :return: quick style symbol in str
         """
-        if self._symbol:
-            return multi_replace(self._symbol, {
-                '**': '',
-                '*': '-',
-                '(': '',
-                ')': '',
-            })
-
-        return self._symbol
+        return self._symbol_quick
 
     @property
     def symbol_python_style(self):
@@ -116,7 +149,7 @@ class Unit:
 
     @property
     def symbol(self):
-        return self.symbol_quick_style
+        return self._symbol_quick
 
     @property
     def factor(self):
@@ -136,17 +169,13 @@ class Unit:
         return f"<Unit('{self}')>"
 
     def __str__(self):
-        return self.symbol
+        return self._symbol_quick
 
     def __format__(self, format_spec=''):
-        if format_spec == '':
-            return self.symbol
-        if format_spec == 'q':
-            return self.symbol_quick_style
-        if format_spec == 'p':
-            return self.symbol_python_style
-
-        raise ValueError('Invalid format specifier')
+        try:
+            return getattr(self, _format_styles[format_spec])
+        except KeyError:
+            raise ValueError('Invalid format specifier') from None
 
     def __mul__(self, other):
         # only for factor definition
@@ -156,14 +185,12 @@ class Unit:
             return Unit(symbol, factor=factor)
 
         if isinstance(other, (int, float)):
-            factor = self.factor * other
-            return Unit('dummy', factor=factor)
+            return _Factor(self.factor * other)
 
         return NotImplemented
 
     def __rmul__(self, other):
-        factor = other * self.factor
-        return Unit('dummy', factor=factor)
+        return _Factor(other * self.factor)
 
     def __truediv__(self, other):
         if isinstance(other, Unit):
@@ -172,15 +199,13 @@ class Unit:
             return Unit(symbol, factor=factor)
 
         if isinstance(other, (int, float)):
-            factor = self.factor / other
-            return Unit('dummy', factor=factor)
+            return _Factor(self.factor / other)
 
         return NotImplemented
 
     def __rtruediv__(self, other):
         if isinstance(other, (int, float)):
-            factor = other / self.factor
-            return Unit('dummy', factor=factor)
+            return _Factor(other / self.factor)
 
         return NotImplemented
 
@@ -202,10 +227,68 @@ class BaseUnit(Unit):
         return a Unit instance with .is_base = True
     """
 
+    __slots__ = ()
+
     def __init__(self, symbol: str):
         super().__init__(symbol)
 
 
+class _Factor:
+    """
+    Bare factor, the result of scaling a unit by a number.
+
+    Only meant for Unit(symbol, defined_by=...), it carries no symbol
+    and supports the same arithmetic as Unit for factor definition.
+    """
+
+    __slots__ = ('factor',)
+
+    def __init__(self, factor: float):
+        self.factor = factor
+
+    def __mul__(self, other):
+        if isinstance(other, (Unit, _Factor)):
+            return _Factor(self.factor * other.factor)
+
+        if isinstance(other, (int, float)):
+            return _Factor(self.factor * other)
+
+        return NotImplemented
+
+    def __rmul__(self, other):
+        if isinstance(other, Unit):
+            return _Factor(other.factor * self.factor)
+
+        if isinstance(other, (int, float)):
+            return _Factor(other * self.factor)
+
+        return NotImplemented
+
+    def __truediv__(self, other):
+        if isinstance(other, (Unit, _Factor)):
+            return _Factor(self.factor / other.factor)
+
+        if isinstance(other, (int, float)):
+            return _Factor(self.factor / other)
+
+        return NotImplemented
+
+    def __rtruediv__(self, other):
+        if isinstance(other, Unit):
+            return _Factor(other.factor / self.factor)
+
+        if isinstance(other, (int, float)):
+            return _Factor(other / self.factor)
+
+        return NotImplemented
+
+    def __pow__(self, power, modulo=None):
+        if isinstance(power, (int, float)):
+            return _Factor(self.factor ** power)
+
+        return NotImplemented
+
+
 # basic unit
 # length, m
 meter = BaseUnit('m')
@@ -283,12 +366,23 @@ pound_force = Unit('lbf', defined_by=constant.G * pound)
 kilomole = BaseUnit('kmol')
 mole = Unit('mol', defined_by=1e-3 * kilomole)
 normal_cubic_meter = Unit('Nm**3', factor=1 / 22.414)
-# @20 degC
-T_60F = kelvin.from_base_unit(fahrenheit.to_base_unit(60))
-T_0C = kelvin.from_base_unit(0)
-T_20C = kelvin.from_base_unit(20)
-standard_cubic_meter = Unit('Sm**3',
-                            factor=lambda: normal_cubic_meter.factor * T_0C / (T_0C + get_standard_temperature()))
+# reference temperatures in K, same values as kelvin.from_base_unit(...) gives
+T_0C = 273.15
+T_20C = T_0C + 20
+T_60F = T_0C + (60 - 32) * 5 / 9
+# kmol per Sm**3 at T_0C, standard conditions scale it by T_0C / T_std
+_normal_cubic_meter_factor_0C = normal_cubic_meter.factor * T_0C
+
+
+def _standard_cubic_meter_factor():
+    """
+    Factor of 'Sm**3' at current standard temperature
+    :return: kmol per Sm**3
+    """
+    return _normal_cubic_meter_factor_0C / (T_0C + config._standard_temperature)
+
+
+standard_cubic_meter = Unit('Sm**3', factor=_standard_cubic_meter_factor)
 standard_cubic_meter_20C = Unit('Sm**3_20C', defined_by=normal_cubic_meter * T_0C / T_20C)
 standard_cubic_meter_60F = Unit('Sm**3_60F', defined_by=normal_cubic_meter * T_0C / T_60F)
 # scf is @60 degF
@@ -353,15 +447,11 @@ kilomole_per_minute = Unit('kmol/min', defined_by=kilomole / minute)
 normal_cubic_meter_per_hour = Unit('Nm**3/h', defined_by=normal_cubic_meter / hour)
 normal_cubic_meter_per_day = Unit('Nm**3/d', defined_by=normal_cubic_meter / day)
 # standard_cubic_meter_per_hour = Unit('Sm**3/h', defined_by=standard_cubic_meter / hour)
-standard_cubic_meter_per_hour = Unit(
-    'Sm**3/h',
-    factor=lambda: normal_cubic_meter.factor * T_0C / (T_0C + get_standard_temperature()) / hour.factor)
+standard_cubic_meter_per_hour = Unit('Sm**3/h', factor=lambda: _standard_cubic_meter_factor() / hour.factor)
 standard_cubic_meter_20C_per_hour = Unit('Sm**3_20C/h', defined_by=standard_cubic_meter_20C / hour)
 standard_cubic_meter_60F_per_hour = Unit('Sm**3_60F/h', defined_by=standard_cubic_meter_60F / hour)
 # standard_cubic_meter_per_day = Unit('Sm**3/d', defined_by=standard_cubic_meter / day)
-standard_cubic_meter_per_day = Unit(
-    'Sm**3/d',
-    factor=lambda: normal_cubic_meter.factor * T_0C / (T_0C + get_standard_temperature()) / day.factor)
+standard_cubic_meter_per_day = Unit('Sm**3/d', factor=lambda: _standard_cubic_meter_factor() / day.factor)
 standard_cubic_meter_20C_per_day = Unit('Sm**3_20C/d', defined_by=standard_cubic_meter_20C / day)
 standard_cubic_meter_60F_per_day = Unit('Sm**3_60F/d', defined_by=standard_cubic_meter_60F / day)
 mole_per_hour = Unit('mol/h', defined_by=mole / hour)
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Iterable
+from typing import Iterable, Union
 
 from . import unit as u
 from .unit import Unit, BaseUnit
@@ -7,35 +7,66 @@ from .unit import Unit, BaseUnit
 
 class UnitRegistry:
     def __init__(self, units: Iterable[Unit], base_unit: Unit = None):
-        self._base_unit = base_unit
-        self._symbol_to_unit = {}
-        if self._base_unit is None:
-            for unit in units:
-                self._symbol_to_unit[unit.symbol] = unit
-                if isinstance(unit, BaseUnit):
-                    self._base_unit = unit
+        # units are fixed once the registry is built
+        units = tuple(units)
+        self._symbol_to_unit = {unit.symbol: unit for unit in units}
+        if base_unit is None:
+            base_unit = next((unit for unit in units if isinstance(unit, BaseUnit)), None)
 
-        elif self._base_unit not in units:
-            raise ValueError(f"Base unit {self._base_unit} is not in the list of units")
+        elif base_unit not in units:
+            raise ValueError(f"Base unit {base_unit} is not in the list of units")
+
+        self._base_unit = base_unit
 
         if self._base_unit is None:
             raise ValueError("No base unit found")
 
         self._units = units
+        self._symbols = tuple(self._symbol_to_unit)
+        # symbols and the units themselves, so either finds a unit in one lookup
+        self._lookup = {**self._symbol_to_unit, **{unit: unit for unit in units}}
 
     @property
     def base_unit(self):
         return self._base_unit
 
-    def get_unit(self, symbol: str):
-        if unit := self._symbol_to_unit.get(symbol):
+    def get_unit(self, symbol: Union[str, Unit]):
+        try:
+            if unit := self._lookup.get(symbol):
+                return unit
+        except TypeError:
+            # unhashable, looked up by str() below like any other symbol
+            pass
+        # e.g. a unit built elsewhere with the same symbol
+        if unit := self._symbol_to_unit.get(str(symbol)):
             return unit
         raise ValueError(f"Unit '{symbol}' not found")
 
+    def convert(self, value, from_unit: Unit, to_unit: Unit):
+        """
+        Convert value between two units of this registry,
+        a list / tuple of values is converted element-wise
+        :param value: numerical value or array-like of values in from_unit
+        :param from_unit: unit value is given in
+        :param to_unit: unit to convert to
+        :return: converted value, a list for list / tuple input
+        """
+        try:
+            return to_unit.from_base_unit(from_unit.to_base_unit(value))
+        except TypeError:
+            # checked only here to keep scalars on the fast path
+            if isinstance(value, (list, tuple)):
+                return [to_unit.from_base_unit(from_unit.to_base_unit(x)) for x in value]
+            raise
+
     @property
     def units(self):
         return self._units
 
+    @property
+    def symbols(self):
+        return self._symbols
+
 
 length = UnitRegistry(units=[
     u.meter,